@@ -2,14 +2,34 @@
 Enterprise Agent - Main agent implementation for business process automation.
 """
 
+import copy
 import yaml
 import logging
-from typing import Dict, Any, List, Optional
+from functools import cached_property, lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-from datetime import datetime
 
 from loguru import logger
 
+from src.utils.helpers import get_iso_timestamp
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized per file version.
+    
+    The modification time is part of the cache key so edits on disk are
+    picked up on the next load. Callers must copy the result before mutating it.
+    """
+    with open(path_str, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 class EnterpriseAgent:
     """
@@ -28,15 +48,35 @@ class EnterpriseAgent:
         Args:
             config_path: Path to YAML configuration file
             config_dict: Configuration dictionary (alternative to config_path)
+        
+        The configuration is not read until it is first needed.
         """
-        self.config = self._load_config(config_path, config_dict)
-        self._setup_logging()
+        self._config_path = config_path
+        self._config_dict = config_dict
         self.logger = logger
+    
+    @cached_property
+    def config(self) -> Dict[str, Any]:
+        """Agent configuration, loaded and applied on first access."""
+        config = self._load_config(self._config_path, self._config_dict)
+        self._setup_logging(config)
         
-        self.name = self.config.get("agent", {}).get("name", "Enterprise Agent")
-        self.version = self.config.get("agent", {}).get("version", "1.0.0")
-        
-        logger.info(f"Initialized {self.name} v{self.version}")
+        agent_config = config.get("agent", {})
+        logger.info(
+            f"Initialized {agent_config.get('name', 'Enterprise Agent')} "
+            f"v{agent_config.get('version', '1.0.0')}"
+        )
+        return config
+    
+    @property
+    def name(self) -> str:
+        """Agent name from configuration."""
+        return self.config.get("agent", {}).get("name", "Enterprise Agent")
+    
+    @property
+    def version(self) -> str:
+        """Agent version from configuration."""
+        return self.config.get("agent", {}).get("version", "1.0.0")
     
     def _load_config(
         self,
@@ -50,8 +90,9 @@ class EnterpriseAgent:
         if config_path:
             config_file = Path(config_path)
             if config_file.exists():
-                with open(config_file, 'r') as f:
-                    return yaml.safe_load(f)
+                config_file = config_file.resolve()
+                mtime_ns = config_file.stat().st_mtime_ns
+                return copy.deepcopy(_parse_yaml_cached(str(config_file), mtime_ns))
             else:
                 raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
@@ -63,9 +104,9 @@ class EnterpriseAgent:
             }
         }
     
-    def _setup_logging(self):
+    def _setup_logging(self, config: Dict[str, Any]):
         """Configure logging based on agent settings."""
-        log_config = self.config.get("logging", {})
+        log_config = config.get("logging", {})
         
         if log_config.get("file_path"):
             log_file = Path(log_config["file_path"])
@@ -93,7 +134,12 @@ class EnterpriseAgent:
         
         Returns:
             Dictionary with task execution results
+        
+        Raises:
+            FileNotFoundError: If the configuration file does not exist
         """
+        # Load configuration (and its log sinks) before doing any work
+        agent_name = self.name
         logger.info(f"Executing task: {task_description}")
         
         try:
@@ -104,8 +150,8 @@ class EnterpriseAgent:
             return {
                 "status": "success",
                 "result": result,
-                "timestamp": datetime.now().isoformat(),
-                "agent": self.name
+                "timestamp": get_iso_timestamp(),
+                "agent": agent_name
             }
         
         except Exception as e:
@@ -113,8 +159,8 @@ class EnterpriseAgent:
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat(),
-                "agent": self.name
+                "timestamp": get_iso_timestamp(),
+                "agent": agent_name
             }
     
     def _process_task(
@@ -175,17 +221,25 @@ class EnterpriseAgent:
                     "error": str(e)
                 }
     
-    def get_capabilities(self) -> List[str]:
-        """Get list of agent capabilities."""
-        return self.config.get("agent", {}).get("capabilities", [])
+    @cached_property
+    def _capabilities(self) -> Tuple[str, ...]:
+        """Capabilities from configuration, resolved once."""
+        return tuple(self.config.get("agent", {}).get("capabilities", []))
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get current agent status."""
+    @cached_property
+    def _status_base(self) -> Dict[str, Any]:
+        """Static part of the status response, built once."""
         return {
             "name": self.name,
             "version": self.version,
             "status": "active",
-            "capabilities": self.get_capabilities(),
-            "timestamp": datetime.now().isoformat()
+            "capabilities": self._capabilities
         }
-
+    
+    def get_capabilities(self) -> List[str]:
+        """Get list of agent capabilities."""
+        return list(self._capabilities)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get current agent status."""
+        return {**self._status_base, "timestamp": get_iso_timestamp()}
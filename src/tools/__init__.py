@@ -1,6 +1,6 @@
 """Tools and utilities for enterprise agent operations."""
 
-from .enterprise_tools import APIClient, DatabaseQuery, FileProcessor
+from .enterprise_tools import APIClient, DatabaseQuery, FileProcessor, QueryBatcher
 
-__all__ = ["APIClient", "DatabaseQuery", "FileProcessor"]
+__all__ = ["APIClient", "DatabaseQuery", "FileProcessor", "QueryBatcher"]
 
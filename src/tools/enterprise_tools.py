@@ -2,11 +2,21 @@
 Enterprise tools for agent operations - API clients, database queries, file processing, etc.
 """
 
+import copy
+import os
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator
 from pathlib import Path
 from loguru import logger
 
+# Responses retried by the API clients, and the exponential backoff between attempts
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_BACKOFF_FACTOR = 0.2
+
 
 class APIClient:
     """Tool for making API calls to enterprise systems."""
@@ -16,7 +26,9 @@ class APIClient:
         base_url: str,
         timeout: int = 30,
         retry_attempts: int = 3,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        cache_ttl: float = 0.0,
+        cache_maxsize: int = 1024
     ):
         """
         Initialize API client.
@@ -26,52 +38,111 @@ class APIClient:
             timeout: Request timeout in seconds
             retry_attempts: Number of retry attempts
             headers: Default headers for requests
+            cache_ttl: Seconds to reuse GET responses for; 0 disables caching
+            cache_maxsize: Maximum number of cached GET responses; 0 disables caching
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.retry_attempts = retry_attempts
         self.headers = headers or {}
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self._cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # Reuse connections across calls; retries are handled by the adapter
+        retries = Retry(
+            total=max(retry_attempts - 1, 0),
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+        self._session = requests.Session()
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
     
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make GET request."""
+        """Make GET request, served from the response cache when enabled."""
+        caching = self.cache_ttl > 0 and self.cache_maxsize > 0
+        key = self._cache_key(endpoint, params) if caching else None
+        if key is not None:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return copy.deepcopy(entry[1])
+        
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
-        for attempt in range(self.retry_attempts):
-            try:
-                response = requests.get(
-                    url,
-                    params=params,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                if attempt == self.retry_attempts - 1:
-                    logger.error(f"API GET request failed after {self.retry_attempts} attempts: {e}")
-                    raise
-                logger.warning(f"API GET request attempt {attempt + 1} failed, retrying...")
+        try:
+            response = self._session.get(url, params=params, headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()
+            result = response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"API GET request failed: {e}")
+            raise
+        
+        if key is not None:
+            now = time.monotonic()
+            with self._cache_lock:
+                self._cache.pop(key, None)
+                # Entries are stored in expiry order, so expired ones are at the front
+                while self._cache:
+                    oldest = next(iter(self._cache))
+                    if self._cache[oldest][0] > now and len(self._cache) < self.cache_maxsize:
+                        break
+                    del self._cache[oldest]
+                self._cache[key] = (now + self.cache_ttl, copy.deepcopy(result))
+        return result
+    
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """
+        Drop cached GET responses.
+        
+        Args:
+            endpoint: Endpoint whose responses to drop; all endpoints if None
+        """
+        with self._cache_lock:
+            if endpoint is None:
+                self._cache.clear()
+            else:
+                endpoint = endpoint.lstrip('/')
+                for key in [key for key in self._cache if key[0] == endpoint]:
+                    del self._cache[key]
+    
+    def _cache_key(self, endpoint: str, params: Optional[Dict]) -> Optional[Tuple]:
+        """Build the GET cache key, or None if the params cannot be sorted or hashed."""
+        try:
+            key = (endpoint.lstrip('/'), tuple(sorted((params or {}).items())))
+            hash(key)
+        except TypeError:
+            return None
+        return key
     
     def post(self, endpoint: str, data: Optional[Dict] = None, json: Optional[Dict] = None) -> Dict[str, Any]:
         """Make POST request."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
-        for attempt in range(self.retry_attempts):
-            try:
-                response = requests.post(
-                    url,
-                    data=data,
-                    json=json,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                if attempt == self.retry_attempts - 1:
-                    logger.error(f"API POST request failed after {self.retry_attempts} attempts: {e}")
-                    raise
-                logger.warning(f"API POST request attempt {attempt + 1} failed, retrying...")
+        try:
+            response = self._session.post(
+                url, data=data, json=json, headers=self.headers, timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"API POST request failed: {e}")
+            raise
+    
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "APIClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
 
 class DatabaseQuery:
@@ -100,8 +171,123 @@ class DatabaseQuery:
         """
         # Placeholder implementation
         # In production, this would use SQLAlchemy or similar ORM
-        logger.info(f"Executing database query: {query[:50]}...")
+        logger.opt(lazy=True).info("Executing database query: {}...", lambda: query[:50])
         return []
+    
+    def execute_many(self, query: str, params_list: List[Dict]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute one query for many parameter sets in a single round-trip.
+        
+        Args:
+            query: SQL query string
+            params_list: Parameters for each execution
+        
+        Returns:
+            Query results for each parameter set, in order
+        """
+        # Placeholder implementation
+        # In production, this would pass params_list to SQLAlchemy's
+        # connection.execute(text(query), params_list) (DB-API executemany)
+        logger.opt(lazy=True).info(
+            "Executing database query x{}: {}...", lambda: len(params_list), lambda: query[:50]
+        )
+        return [[] for _ in params_list]
+    
+    def execute_query_in(self, query: str, column: str, values: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Fetch rows for many key values with a single IN query.
+        
+        Args:
+            query: SQL query string without a WHERE clause, e.g. "SELECT * FROM orders"
+            column: Column to match against values
+            values: Values to look up
+        
+        Returns:
+            Query results as list of dictionaries
+        """
+        if not all(part.isidentifier() for part in column.split('.')):
+            raise ValueError(f"Invalid column name: {column}")
+        if not values:
+            return []
+        
+        params = {f"in_{i}": value for i, value in enumerate(values)}
+        placeholders = ", ".join(f":{name}" for name in params)
+        return self.execute_query(f"{query} WHERE {column} IN ({placeholders})", params)
+    
+    def batch(self) -> "QueryBatcher":
+        """
+        Start a batch of queries to be sent together.
+        
+        Returns:
+            QueryBatcher bound to this database
+        """
+        return QueryBatcher(self)
+
+
+class QueryBatcher:
+    """
+    Collects queries and executes them with one round-trip per distinct statement.
+    
+    Used as a context manager, any queries left queued at the end of the block
+    are flushed and their results discarded, so exit-time flushing is only
+    suitable for writes.
+    """
+    
+    def __init__(self, db: DatabaseQuery):
+        """
+        Initialize query batcher.
+        
+        Args:
+            db: Database query tool used to execute the batch
+        """
+        self.db = db
+        self._queries: List[Tuple[str, Dict]] = []
+    
+    def add(self, query: str, params: Optional[Dict] = None) -> int:
+        """
+        Queue a query.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+        
+        Returns:
+            Index of this query's results in the list returned by flush()
+        """
+        self._queries.append((query, params or {}))
+        return len(self._queries) - 1
+    
+    def flush(self) -> List[List[Dict[str, Any]]]:
+        """
+        Execute all queued queries.
+        
+        Returns:
+            Results for each queued query, in the order they were added
+        """
+        grouped: Dict[str, List[int]] = {}
+        for index, (query, _) in enumerate(self._queries):
+            grouped.setdefault(query, []).append(index)
+        
+        results: List[List[Dict[str, Any]]] = [[] for _ in self._queries]
+        for query, indices in grouped.items():
+            batch_results = self.db.execute_many(query, [self._queries[i][1] for i in indices])
+            for index, rows in zip(indices, batch_results):
+                results[index] = rows
+        
+        self._queries = []
+        return results
+    
+    def __enter__(self) -> "QueryBatcher":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Queries still queued on exit are executed for their side effects;
+        # call flush() inside the block to get their results
+        if exc_type is None and self._queries:
+            logger.warning(
+                f"Flushing {len(self._queries)} queued queries on exit; their results are discarded"
+            )
+            self.flush()
 
 
 class FileProcessor:
@@ -115,6 +301,7 @@ class FileProcessor:
             base_path: Base path for file operations
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        self._base_path_str = str(self.base_path)
         logger.info(f"File processor initialized with base path: {self.base_path}")
     
     def read_file(self, file_path: str) -> str:
@@ -127,13 +314,14 @@ class FileProcessor:
         Returns:
             File content as string
         """
-        full_path = self.base_path / file_path
+        full_path = os.path.join(self._base_path_str, file_path)
         logger.info(f"Reading file: {full_path}")
         
-        if not full_path.exists():
+        if not os.path.exists(full_path):
             raise FileNotFoundError(f"File not found: {full_path}")
         
-        return full_path.read_text(encoding='utf-8')
+        with open(full_path, 'r', encoding='utf-8') as f:
+            return f.read()
     
     def write_file(self, file_path: str, content: str) -> None:
         """
@@ -143,11 +331,56 @@ class FileProcessor:
             file_path: Path to file (relative to base_path)
             content: Content to write
         """
-        full_path = self.base_path / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path = os.path.join(self._base_path_str, file_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        
+        logger.info(f"Writing file: {full_path}")
+        with open(full_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    
+    def iter_lines(self, file_path: str, chunk_size: int = 1 << 20) -> Iterator[str]:
+        """
+        Stream a file line by line without loading it into memory.
+        
+        Args:
+            file_path: Path to file (relative to base_path)
+            chunk_size: Read buffer size in bytes
+        
+        Returns:
+            Iterator over the lines of the file, including line endings
+        
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        full_path = os.path.join(self._base_path_str, file_path)
+        logger.info(f"Streaming file: {full_path}")
+        
+        if not os.path.exists(full_path):
+            raise FileNotFoundError(f"File not found: {full_path}")
+        
+        return self._iter_open_lines(full_path, chunk_size)
+    
+    @staticmethod
+    def _iter_open_lines(full_path: str, chunk_size: int) -> Iterator[str]:
+        """Yield lines of an existing file through a buffered reader."""
+        with open(full_path, 'r', encoding='utf-8', buffering=chunk_size) as f:
+            yield from f
+    
+    def write_stream(self, file_path: str, chunks: Iterable[str]) -> None:
+        """
+        Write content to file chunk by chunk.
+        
+        Args:
+            file_path: Path to file (relative to base_path)
+            chunks: Pieces of content to write, in order
+        """
+        full_path = os.path.join(self._base_path_str, file_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
         
         logger.info(f"Writing file: {full_path}")
-        full_path.write_text(content, encoding='utf-8')
+        with open(full_path, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
 
     def list_files(self, directory: str = ".", pattern: str = "*") -> List[str]:
         """
@@ -0,0 +1,114 @@
+"""
+Asynchronous enterprise tools - API client for high-concurrency workflows.
+"""
+
+import asyncio
+from typing import Dict, Any, Optional
+
+import aiohttp
+from loguru import logger
+
+from .enterprise_tools import RETRY_BACKOFF_FACTOR, RETRY_STATUS_CODES
+
+
+class AsyncAPIClient:
+    """Tool for making concurrent API calls to enterprise systems from one event loop."""
+    
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        retry_attempts: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+        limit: int = 256,
+        limit_per_host: int = 32
+    ):
+        """
+        Initialize async API client.
+        
+        Args:
+            base_url: Base URL for API
+            timeout: Request timeout in seconds
+            retry_attempts: Number of retry attempts
+            headers: Default headers for requests
+            limit: Maximum number of open connections
+            limit_per_host: Maximum number of open connections per host
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.headers = headers or {}
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it inside the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+    
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Make a request, retrying like APIClient.
+        
+        Connection errors, timeouts and 429/5xx responses are retried with
+        exponential backoff; other error responses fail immediately.
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        session = self._get_session()
+        
+        for attempt in range(self.retry_attempts):
+            last_attempt = attempt == self.retry_attempts - 1
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    if response.status in RETRY_STATUS_CODES and not last_attempt:
+                        logger.warning(
+                            f"API {method} request attempt {attempt + 1} returned {response.status}, retrying..."
+                        )
+                    else:
+                        response.raise_for_status()
+                        return await response.json()
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"API {method} request failed: {e}")
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    logger.error(f"API {method} request failed: {e}")
+                    raise
+                logger.warning(f"API {method} request attempt {attempt + 1} failed, retrying...")
+            
+            # Same schedule as urllib3's Retry: no delay before the first retry
+            if attempt > 0:
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** attempt)
+        
+        raise RuntimeError("retry_attempts must be at least 1")
+    
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make GET request."""
+        return await self._request("GET", endpoint, params=params)
+    
+    async def post(self, endpoint: str, data: Optional[Dict] = None, json: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make POST request."""
+        return await self._request("POST", endpoint, data=data, json=json)
+    
+    async def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -1,6 +1,6 @@
 """Utility functions and helpers."""
 
-from .helpers import validate_config, format_output, get_timestamp
+from .helpers import validate_config, format_output, get_timestamp, get_iso_timestamp
 
-__all__ = ["validate_config", "format_output", "get_timestamp"]
+__all__ = ["validate_config", "format_output", "get_timestamp", "get_iso_timestamp"]
 
@@ -1,8 +1,30 @@
 """Helper utility functions."""
 
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet, Tuple
 from datetime import datetime
+from functools import lru_cache
 import json
+import math
+import time
+
+try:
+    import orjson
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
+# Passthrough options route datetimes and dataclasses to default=str, as json.dumps does
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if _has_orjson else 0
+)
+
+
+_REQUIRED_KEYS: FrozenSet[str] = frozenset({"agent"})
+
+# (second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second
+_iso_second: Tuple[int, str] = (0, "")
 
 
 def validate_config(config: Dict[str, Any]) -> bool:
@@ -15,11 +37,9 @@ def validate_config(config: Dict[str, Any]) -> bool:
     Returns:
         True if valid, raises ValueError otherwise
     """
-    required_keys = ["agent"]
-    
-    for key in required_keys:
-        if key not in config:
-            raise ValueError(f"Missing required configuration key: {key}")
+    missing = _REQUIRED_KEYS - config.keys()
+    if missing:
+        raise ValueError(f"Missing required configuration keys: {sorted(missing)}")
     
     return True
 
@@ -28,6 +48,14 @@ def format_output(data: Any, format_type: str = "dict") -> str:
     """
     Format output data.
     
+    JSON output uses orjson when it is installed. Unlike ``json.dumps``, it
+    writes non-ASCII text unescaped, formats exponents without a sign
+    (``1e20`` rather than ``1e+20``) and writes enum members as their value
+    (``"a"`` rather than ``"C.A"``). Data containing NaN or infinity is
+    always formatted with ``json.dumps``, which keeps those values instead
+    of turning them into ``null``. Other types, such as numpy arrays, are
+    passed to ``str`` as with ``json.dumps``.
+    
     Args:
         data: Data to format
         format_type: Output format ("dict", "json", "string")
@@ -36,6 +64,15 @@ def format_output(data: Any, format_type: str = "dict") -> str:
         Formatted string
     """
     if format_type == "json":
+        if _has_orjson:
+            try:
+                output = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits; let the stdlib handle it
+            else:
+                # orjson writes NaN/Infinity as null; only scan the data when null appears
+                if b"null" not in output or not _has_non_finite(data):
+                    return output.decode()
         return json.dumps(data, indent=2, default=str)
     elif format_type == "string":
         return str(data)
@@ -43,6 +80,17 @@ def format_output(data: Any, format_type: str = "dict") -> str:
         return str(data)
 
 
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data contains a NaN or infinite float."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(key) or _has_non_finite(value) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(item) for item in data)
+    return False
+
+
 def get_timestamp(format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     """
     Get current timestamp as formatted string.
@@ -53,5 +101,34 @@ def get_timestamp(format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     Returns:
         Formatted timestamp string
     """
-    return datetime.now().strftime(format_str)
+    if "%f" in format_str:
+        return datetime.now().strftime(format_str)
+    return _format_second(int(time.time()), format_str)
+
+
+def get_iso_timestamp() -> str:
+    """
+    Get current local time in ISO 8601 format with microseconds.
+    
+    Equivalent to ``datetime.now().isoformat()``, but the seconds part is
+    only formatted once per second.
+    
+    Returns:
+        Timestamp string, e.g. "2025-11-14T09:30:00.123456"
+    """
+    global _iso_second
+    
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _iso_second = (sec, prefix)
+    return f"{prefix}.{int((now - sec) * 1_000_000):06d}"
+
+
+@lru_cache(maxsize=32)
+def _format_second(sec: int, format_str: str) -> str:
+    """Format a whole-second local timestamp, memoized per second and format."""
+    return datetime.fromtimestamp(sec).strftime(format_str)
 
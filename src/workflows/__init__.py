@@ -1,6 +1,6 @@
 """Workflow engine and business process definitions."""
 
-from .workflow_engine import WorkflowEngine, Workflow
+from .workflow_engine import WorkflowEngine, AsyncWorkflowEngine, Workflow
 
-__all__ = ["WorkflowEngine", "Workflow"]
+__all__ = ["WorkflowEngine", "AsyncWorkflowEngine", "Workflow"]
 
@@ -2,7 +2,14 @@
 Workflow engine for defining and executing business processes.
 """
 
-from typing import Dict, Any, List, Callable, Optional
+import asyncio
+import hashlib
+import inspect
+import pickle
+import sys
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Callable, FrozenSet, Iterable, Optional, Set, Tuple
 from loguru import logger
 from dataclasses import dataclass
 from enum import Enum
@@ -17,15 +24,20 @@ class TaskStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_TASK_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_TASK_DATACLASS_OPTIONS)
 class Task:
     """Represents a workflow task."""
     name: str
     action: Callable
-    dependencies: List[str]
+    dependencies: FrozenSet[str]
     status: TaskStatus = TaskStatus.PENDING
     result: Any = None
     error: Optional[str] = None
+    cacheable: bool = False
 
 
 class Workflow:
@@ -42,12 +54,19 @@ class Workflow:
         self.name = name
         self.description = description
         self.tasks: Dict[str, Task] = {}
+        self._topo_order: Optional[List[str]] = None
+        self._successors: Dict[str, List[str]] = {}
+        self._indegree: Dict[str, int] = {}
+        self._levels: Optional[List[List[str]]] = None
+        self._order_dirty = True
+        self._revision = 0
     
     def add_task(
         self,
         name: str,
         action: Callable,
-        dependencies: Optional[List[str]] = None
+        dependencies: Optional[Iterable[str]] = None,
+        cacheable: bool = False
     ) -> None:
         """
         Add a task to the workflow.
@@ -56,26 +75,163 @@ class Workflow:
             name: Task name
             action: Function to execute for this task
             dependencies: List of task names this task depends on
+            cacheable: Reuse the result of earlier runs with the same context.
+                Only set this for deterministic actions.
         """
         self.tasks[name] = Task(
             name=name,
             action=action,
-            dependencies=dependencies or []
+            dependencies=frozenset(dependencies or ()),
+            cacheable=cacheable
         )
+        self._order_dirty = True
+        self._revision += 1
     
     def get_task(self, name: str) -> Optional[Task]:
         """Get a task by name."""
         return self.tasks.get(name)
+    
+    def topo_order(self) -> List[str]:
+        """
+        Get task names in dependency order.
+        
+        The order is computed once and reused until another task is added.
+        
+        Returns:
+            Task names, each listed after all of its dependencies
+        
+        Raises:
+            RuntimeError: If the workflow has circular or missing dependencies
+        """
+        if self._order_dirty or self._topo_order is None:
+            self._build_graph()
+            indegree = dict(self._indegree)
+            successors = self._successors
+            
+            ready = deque(name for name, count in indegree.items() if count == 0)
+            order = []
+            while ready:
+                name = ready.popleft()
+                order.append(name)
+                for succ in successors[name]:
+                    indegree[succ] -= 1
+                    if indegree[succ] == 0:
+                        ready.append(succ)
+            
+            if len(order) < len(self.tasks):
+                # Circular dependency or missing dependency
+                ordered = set(order)
+                remaining = [name for name in self.tasks.keys() if name not in ordered]
+                raise RuntimeError(f"Cannot execute workflow: circular dependency or missing dependencies. Remaining tasks: {remaining}")
+            
+            self._topo_order = order
+            self._levels = None
+            self._order_dirty = False
+        
+        return self._topo_order
+    
+    def dependency_graph(self) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+        """
+        Get the successor lists and dependency counts of all tasks.
+        
+        Returns:
+            Tuple of (successors, indegree). Callers must copy indegree
+            before modifying it.
+        
+        Raises:
+            RuntimeError: If the workflow has circular or missing dependencies
+        """
+        self.topo_order()
+        return self._successors, self._indegree
+    
+    def _build_graph(self) -> None:
+        """Compute successor lists and dependency counts from the tasks."""
+        self._indegree = {name: len(task.dependencies) for name, task in self.tasks.items()}
+        self._successors = {name: [] for name in self.tasks}
+        for name, task in self.tasks.items():
+            for dep in task.dependencies:
+                if dep in self._successors:
+                    self._successors[dep].append(name)
+    
+    def levels(self) -> List[List[str]]:
+        """
+        Group tasks into levels that can run concurrently.
+        
+        Every task in a level depends only on tasks in earlier levels.
+        
+        Returns:
+            Task names grouped by level, in execution order
+        """
+        order = self.topo_order()
+        if self._levels is None:
+            depth: Dict[str, int] = {}
+            levels: List[List[str]] = []
+            for name in order:
+                level = 1 + max((depth[dep] for dep in self.tasks[name].dependencies), default=-1)
+                depth[name] = level
+                if level == len(levels):
+                    levels.append([])
+                levels[level].append(name)
+            self._levels = levels
+        
+        return self._levels
 
 
 class WorkflowEngine:
     """Engine for executing workflows."""
     
-    def __init__(self):
-        """Initialize workflow engine."""
+    def __init__(
+        self,
+        max_workers: int = 5,
+        executor: Optional[Executor] = None,
+        cache_maxsize: int = 128
+    ):
+        """
+        Initialize workflow engine.
+        
+        Args:
+            max_workers: Maximum number of tasks run concurrently; 1 runs
+                tasks one at a time on the calling thread
+            executor: Executor to run task actions on instead of the engine's
+                own thread pool, e.g. a ProcessPoolExecutor for CPU-bound
+                actions. The caller remains responsible for shutting it down.
+            cache_maxsize: Maximum number of cached results kept per cacheable task
+        """
         self.workflows: Dict[str, Workflow] = {}
+        self.max_workers = max_workers
+        self._owns_pool = executor is None
+        self._pool: Executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="wf"
+        )
+        self.cache_maxsize = cache_maxsize
+        # (workflow name, task name) -> (action the results came from, results by context digest)
+        self._result_cache: Dict[Tuple[str, str], Tuple[Callable, "OrderedDict[str, Any]"]] = {}
+        # Workflow name -> (workflow revision, compiled runner or None if not eligible)
+        self._compiled: Dict[str, Tuple[int, Optional[Callable[[Dict[str, Any]], None]]]] = {}
         logger.info("Workflow engine initialized")
     
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], **kwargs: Any) -> "WorkflowEngine":
+        """
+        Create an engine from agent configuration.
+        
+        Reads ``workflows.max_concurrent_tasks`` and
+        ``workflows.enable_parallel_execution`` from settings.yaml.
+        
+        Args:
+            config: Configuration dictionary
+            **kwargs: Additional constructor arguments
+        
+        Returns:
+            Configured workflow engine
+        """
+        workflow_config = config.get("workflows", {})
+        max_workers = workflow_config.get("max_concurrent_tasks", 5)
+        if not workflow_config.get("enable_parallel_execution", True):
+            max_workers = 1
+        return cls(max_workers=max_workers, **kwargs)
+    
     def register_workflow(self, workflow: Workflow) -> None:
         """
         Register a workflow.
@@ -84,6 +240,7 @@ class WorkflowEngine:
             workflow: Workflow instance to register
         """
         self.workflows[workflow.name] = workflow
+        self._compiled.pop(workflow.name, None)
         logger.info(f"Registered workflow: {workflow.name}")
     
     def execute_workflow(
@@ -108,40 +265,122 @@ class WorkflowEngine:
         logger.info(f"Executing workflow: {workflow_name}")
         
         context = context or {}
-        executed_tasks = set()
         
-        # Execute tasks respecting dependencies
-        while len(executed_tasks) < len(workflow.tasks):
-            progress_made = False
-            
-            for task_name, task in workflow.tasks.items():
-                if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED]:
-                    continue
-                
-                # Check if dependencies are met
-                if all(dep in executed_tasks for dep in task.dependencies):
+        runner = self._get_compiled(workflow)
+        if runner is not None:
+            runner(context)
+            return self._collect_results(workflow)
+        
+        # Execute tasks as soon as all of their dependencies have finished
+        successors, indegree = workflow.dependency_graph()
+        indegree = dict(indegree)
+        ready = deque(name for name, count in indegree.items() if count == 0)
+        
+        def release(task_name: str) -> None:
+            for succ in successors[task_name]:
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    ready.append(succ)
+        
+        if self.max_workers <= 1 and self._owns_pool:
+            while ready:
+                task_name = ready.popleft()
+                self._run_task(workflow_name, workflow.tasks[task_name], context)
+                release(task_name)
+        else:
+            running: Dict[Future, Tuple[Task, Any]] = {}
+            pending: Set[Future] = set()
+            while ready or pending:
+                while ready:
+                    task_name = ready.popleft()
+                    task = workflow.tasks[task_name]
+                    hit, cache = self._start_task(workflow_name, task, context)
+                    if hit:
+                        release(task_name)
+                        continue
+                    future = self._pool.submit(task.action, context)
+                    running[future] = (task, cache)
+                    pending.add(future)
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task, cache = running.pop(future)
                     try:
-                        task.status = TaskStatus.RUNNING
-                        logger.info(f"Executing task: {task_name}")
-                        
-                        task.result = task.action(context)
-                        task.status = TaskStatus.COMPLETED
-                        executed_tasks.add(task_name)
-                        progress_made = True
-                        
+                        self._complete_task(task, cache, future.result())
                     except Exception as e:
-                        task.status = TaskStatus.FAILED
-                        task.error = str(e)
-                        logger.error(f"Task {task_name} failed: {e}")
-                        executed_tasks.add(task_name)
-                        progress_made = True
-            
-            if not progress_made:
-                # Circular dependency or missing dependency
-                remaining = [name for name in workflow.tasks.keys() if name not in executed_tasks]
-                raise RuntimeError(f"Cannot execute workflow: circular dependency or missing dependencies. Remaining tasks: {remaining}")
+                        self._fail_task(task, e)
+                    release(task.name)
+        
+        return self._collect_results(workflow)
+    
+    def _get_compiled(self, workflow: Workflow) -> Optional[Callable[[Dict[str, Any]], None]]:
+        """
+        Get the straight-line runner for a workflow, compiling it if needed.
+        
+        A workflow is compiled when its tasks would run one at a time on the
+        calling thread anyway: the engine is serial, or no two tasks can run
+        concurrently. Workflows with cacheable tasks, and engines given an
+        executor, always use the dispatcher.
+        
+        Returns:
+            Compiled runner, or None if the workflow is not eligible
+        """
+        compiled = self._compiled.get(workflow.name)
+        if compiled is not None and compiled[0] == workflow._revision:
+            return compiled[1]
         
-        # Collect results
+        runner = None
+        order = workflow.topo_order()
+        serial = self._owns_pool and (
+            self.max_workers <= 1 or all(len(level) == 1 for level in workflow.levels())
+        )
+        if serial and not any(task.cacheable for task in workflow.tasks.values()):
+            runner = self._compile_runner(workflow.name, [workflow.tasks[name] for name in order])
+        
+        self._compiled[workflow.name] = (workflow._revision, runner)
+        return runner
+    
+    def _compile_runner(self, workflow_name: str, tasks: List[Task]) -> Callable[[Dict[str, Any]], None]:
+        """
+        Generate a function that runs tasks in the given order without dispatch overhead.
+        
+        Args:
+            workflow_name: Name of the workflow, used in the generated filename
+            tasks: Tasks in topological order
+        
+        Returns:
+            Function taking the workflow context
+        """
+        namespace: Dict[str, Any] = {
+            "_RUNNING": TaskStatus.RUNNING,
+            "_COMPLETED": TaskStatus.COMPLETED,
+            "_info": logger.info,
+            "_fail": self._fail_task,
+        }
+        lines = ["def _run(ctx):"]
+        for index, task in enumerate(tasks):
+            namespace[f"_t{index}"] = task
+            lines += [
+                f"    t = _t{index}",
+                "    t.status = _RUNNING",
+                "    t.result = None",
+                "    t.error = None",
+                "    _info('Executing task: {}', t.name)",
+                "    try:",
+                "        t.result = t.action(ctx)",
+                "        t.status = _COMPLETED",
+                "    except Exception as e:",
+                "        _fail(t, e)",
+            ]
+        if not tasks:
+            lines.append("    pass")
+        
+        exec(compile("\n".join(lines), f"<workflow {workflow_name}>", "exec"), namespace)
+        return namespace["_run"]
+    
+    def _collect_results(self, workflow: Workflow) -> Dict[str, Any]:
+        """Collect per-task results and log the workflow summary."""
         results = {
             task_name: {
                 "status": task.status.value,
@@ -152,7 +391,190 @@ class WorkflowEngine:
         }
         
         success_count = sum(1 for t in workflow.tasks.values() if t.status == TaskStatus.COMPLETED)
-        logger.info(f"Workflow {workflow_name} completed: {success_count}/{len(workflow.tasks)} tasks succeeded")
+        logger.info(f"Workflow {workflow.name} completed: {success_count}/{len(workflow.tasks)} tasks succeeded")
         
         return results
+    
+    def close(self) -> None:
+        """Shut down the engine's thread pool, waiting for running tasks."""
+        if self._owns_pool:
+            self._pool.shutdown(wait=True)
+    
+    def __enter__(self) -> "WorkflowEngine":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def invalidate_cache(self, task_name: Optional[str] = None) -> None:
+        """
+        Drop cached task results.
+        
+        Args:
+            task_name: Task whose results to drop; all tasks if None
+        """
+        if task_name is None:
+            self._result_cache.clear()
+        else:
+            for slot in [slot for slot in self._result_cache if slot[1] == task_name]:
+                del self._result_cache[slot]
+    
+    def _cache_key(self, context: Dict[str, Any]) -> Optional[str]:
+        """Build the result cache key for a context, or None if the context cannot be hashed."""
+        try:
+            payload = pickle.dumps(sorted(context.items()), protocol=5)
+        except Exception:
+            return None
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _cache_entries(self, workflow_name: str, task: Task) -> "OrderedDict[str, Any]":
+        """Get a task's cached results, discarding them if the task's action was replaced."""
+        slot = (workflow_name, task.name)
+        cached = self._result_cache.get(slot)
+        if cached is None or cached[0] is not task.action:
+            cached = (task.action, OrderedDict())
+            self._result_cache[slot] = cached
+        return cached[1]
+    
+    def _run_task(self, workflow_name: str, task: Task, context: Dict[str, Any]) -> None:
+        """
+        Run a single task, recording its result or error.
+        
+        Args:
+            workflow_name: Name of the workflow the task belongs to
+            task: Task to run
+            context: Workflow context passed to the task action
+        """
+        hit, cache = self._start_task(workflow_name, task, context)
+        if hit:
+            return
+        
+        try:
+            self._complete_task(task, cache, task.action(context))
+        except Exception as e:
+            self._fail_task(task, e)
+    
+    def _start_task(
+        self,
+        workflow_name: str,
+        task: Task,
+        context: Dict[str, Any]
+    ) -> Tuple[bool, Optional[Tuple["OrderedDict[str, Any]", str]]]:
+        """
+        Mark a task as running, or complete it from the result cache.
+        
+        Returns:
+            Tuple of (cache hit, (cache entries, key) or None if the task is not cached)
+        """
+        key = self._cache_key(context) if task.cacheable else None
+        if key is None:
+            cache = None
+        else:
+            entries = self._cache_entries(workflow_name, task)
+            cache = (entries, key)
+            if key in entries:
+                entries.move_to_end(key)
+                task.result = entries[key]
+                task.status = TaskStatus.COMPLETED
+                task.error = None
+                return True, cache
+        
+        task.status = TaskStatus.RUNNING
+        task.result = None
+        task.error = None
+        logger.info("Executing task: {}", task.name)
+        return False, cache
+    
+    def _complete_task(
+        self,
+        task: Task,
+        cache: Optional[Tuple["OrderedDict[str, Any]", str]],
+        result: Any
+    ) -> None:
+        """Record a successful task result, caching it if requested."""
+        task.result = result
+        task.status = TaskStatus.COMPLETED
+        if cache is not None:
+            entries, key = cache
+            entries[key] = result
+            if len(entries) > self.cache_maxsize:
+                entries.popitem(last=False)
+    
+    def _fail_task(self, task: Task, error: Exception) -> None:
+        """Record a task failure."""
+        task.status = TaskStatus.FAILED
+        task.error = str(error)
+        logger.error(f"Task {task.name} failed: {error}")
 
+
+class AsyncWorkflowEngine(WorkflowEngine):
+    """Engine for executing workflows whose task actions are coroutines."""
+    
+    async def execute_workflow(
+        self,
+        workflow_name: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a workflow on the running event loop.
+        
+        Ready tasks are awaited concurrently. Actions may be coroutine
+        functions or plain functions; plain functions run on the loop.
+        
+        Args:
+            workflow_name: Name of workflow to execute
+            context: Optional context dictionary
+        
+        Returns:
+            Execution results
+        """
+        if workflow_name not in self.workflows:
+            raise ValueError(f"Workflow not found: {workflow_name}")
+        
+        workflow = self.workflows[workflow_name]
+        logger.info(f"Executing workflow: {workflow_name}")
+        
+        context = context or {}
+        
+        # Execute tasks as soon as all of their dependencies have finished
+        successors, indegree = workflow.dependency_graph()
+        indegree = dict(indegree)
+        ready = deque(name for name, count in indegree.items() if count == 0)
+        running: Dict[asyncio.Future, str] = {}
+        
+        while ready or running:
+            while ready:
+                task_name = ready.popleft()
+                future = asyncio.ensure_future(
+                    self._run_task_async(workflow_name, workflow.tasks[task_name], context)
+                )
+                running[future] = task_name
+            done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                for succ in successors[running.pop(future)]:
+                    indegree[succ] -= 1
+                    if indegree[succ] == 0:
+                        ready.append(succ)
+        
+        return self._collect_results(workflow)
+    
+    async def _run_task_async(self, workflow_name: str, task: Task, context: Dict[str, Any]) -> None:
+        """
+        Run a single task, awaiting its action if it returns an awaitable.
+        
+        Args:
+            workflow_name: Name of the workflow the task belongs to
+            task: Task to run
+            context: Workflow context passed to the task action
+        """
+        hit, cache = self._start_task(workflow_name, task, context)
+        if hit:
+            return
+        
+        try:
+            result = task.action(context)
+            if inspect.isawaitable(result):
+                result = await result
+            self._complete_task(task, cache, result)
+        except Exception as e:
+            self._fail_task(task, e)
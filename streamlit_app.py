@@ -20,7 +20,7 @@ st.set_page_config(
 @st.cache_resource
 def get_agent_and_engine():
     agent = EnterpriseAgent()
-    engine = WorkflowEngine()
+    engine = WorkflowEngine.from_config(agent.config)
     
     # Register example workflow
     workflow = Workflow("order_processing", "Process customer orders")
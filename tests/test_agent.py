@@ -1,7 +1,9 @@
 """Tests for Enterprise Agent."""
 
+import os
+
 import pytest
-from src.agents.enterprise_agent import EnterpriseAgent
+from src.agents.enterprise_agent import EnterpriseAgent, _parse_yaml_cached
 
 
 def test_agent_initialization():
@@ -59,3 +61,45 @@ def test_agent_status():
     assert status["status"] == "active"
     assert "timestamp" in status
 
+
+
+def test_config_loaded_lazily():
+    """Test that the configuration file is not read until first use."""
+    agent = EnterpriseAgent(config_path="does/not/exist.yaml")
+    assert "config" not in agent.__dict__
+    
+    with pytest.raises(FileNotFoundError):
+        agent.get_capabilities()
+
+
+def test_config_file_parsed_once(tmp_path):
+    """Test that agents sharing a config file reuse the parsed YAML."""
+    config_file = tmp_path / "settings.yaml"
+    config_file.write_text("agent:\n  name: File Agent\n")
+    _parse_yaml_cached.cache_clear()
+    
+    first = EnterpriseAgent(config_path=str(config_file))
+    second = EnterpriseAgent(config_path=str(config_file))
+    
+    assert first.name == second.name == "File Agent"
+    assert first.config is not second.config
+    info = _parse_yaml_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    
+    config_file.write_text("agent:\n  name: Edited Agent\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert EnterpriseAgent(config_path=str(config_file)).name == "Edited Agent"
+    assert _parse_yaml_cached.cache_info().misses == 2
+
+
+def test_missing_config_fails_before_task_runs(monkeypatch):
+    """Test that a missing config file is reported before the task is processed."""
+    agent = EnterpriseAgent(config_path="does/not/exist.yaml")
+    processed = []
+    monkeypatch.setattr(agent, "_process_task", lambda *args: processed.append(args))
+    
+    with pytest.raises(FileNotFoundError):
+        agent.execute_task("echo hi")
+    assert processed == []
@@ -0,0 +1,72 @@
+"""Tests for helper utilities."""
+
+import json
+from datetime import datetime
+from enum import Enum
+
+import pytest
+
+from src.utils import helpers
+from src.utils.helpers import format_output, get_iso_timestamp, get_timestamp
+
+
+def test_get_timestamp_matches_datetime(monkeypatch):
+    """Test that cached timestamp formatting matches datetime.strftime."""
+    now = 1_700_000_000.25
+    monkeypatch.setattr(helpers.time, "time", lambda: now)
+    
+    for format_str in ("%Y-%m-%d %H:%M:%S", "%Z %z", "%A %j"):
+        assert get_timestamp(format_str) == datetime.fromtimestamp(int(now)).strftime(format_str)
+
+
+def test_get_iso_timestamp_matches_isoformat(monkeypatch):
+    """Test that the fast ISO timestamp matches datetime.isoformat, including across seconds."""
+    for now in (1_700_000_000.5, 1_700_000_001.25):
+        monkeypatch.setattr(helpers.time, "time", lambda: now)
+        expected = datetime.fromtimestamp(int(now)).isoformat()
+        assert get_iso_timestamp() == f"{expected}.{int((now - int(now)) * 1_000_000):06d}"
+
+
+def test_format_output_json_keeps_non_finite_floats():
+    """Test that NaN and infinity are formatted as json.dumps does, not as null."""
+    data = {"x": float("nan"), "y": [float("inf")]}
+    
+    assert format_output(data, "json") == json.dumps(data, indent=2, default=str)
+
+
+def test_format_output_json_accepted_differences():
+    """Test the documented differences between the orjson and stdlib JSON output."""
+    data = {"name": "é", "big": 1e20, "when": datetime(2025, 1, 1)}
+    output = format_output(data, "json")
+    
+    assert json.loads(output) == {"name": "é", "big": 1e20, "when": "2025-01-01 00:00:00"}
+    if helpers._has_orjson:
+        assert '"é"' in output
+        assert "1e20" in output
+    else:
+        assert output == json.dumps(data, indent=2, default=str)
+
+
+def test_format_output_json_null_without_nan():
+    """Test that genuine nulls are kept when the data has no NaN."""
+    data = {"x": None, "y": 1.5}
+    
+    assert json.loads(format_output(data, "json")) == data
+
+
+def test_format_output_json_enum_difference():
+    """Test the documented enum difference between orjson and json.dumps."""
+    class Color(Enum):
+        RED = "red"
+    
+    output = json.loads(format_output({"color": Color.RED}, "json"))
+    
+    assert output == {"color": "red" if helpers._has_orjson else "Color.RED"}
+
+
+def test_format_output_json_numpy_array_matches_stdlib():
+    """Test that numpy arrays are formatted with str, as json.dumps(default=str) does."""
+    np = pytest.importorskip("numpy")
+    data = {"values": np.array([1.0, float("nan")])}
+    
+    assert format_output(data, "json") == json.dumps(data, indent=2, default=str)
@@ -0,0 +1,246 @@
+"""Tests for enterprise tools."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, List, Tuple
+
+import pytest
+import requests
+
+from src.tools import enterprise_tools
+from src.tools.enterprise_tools import APIClient, DatabaseQuery, FileProcessor
+
+
+class _RecordingServer(HTTPServer):
+    """HTTP server that records requests and replies with queued statuses."""
+    
+    requests: List[Tuple[str, str, Dict[str, Any]]]
+    statuses: List[int]
+    
+    def __init__(self, server_address: Tuple[str, int]):
+        super().__init__(server_address, _RecordingHandler)
+        self.requests = []
+        self.statuses = []
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """Replies with a JSON counter, or the status queued in server.statuses."""
+    
+    def _reply(self):
+        server = self.server
+        assert isinstance(server, _RecordingServer)
+        server.requests.append((self.command, self.path, dict(self.headers)))
+        status = server.statuses.pop(0) if server.statuses else 200
+        body = json.dumps({"count": len(server.requests)}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    do_GET = _reply
+    do_POST = _reply
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Local HTTP server recording the requests it receives."""
+    httpd = _RecordingServer(("127.0.0.1", 0))
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _client(server, **kwargs):
+    return APIClient(f"http://127.0.0.1:{server.server_port}", **kwargs)
+
+
+def test_api_client_raises_http_error_after_retries(server):
+    """Test that a persistent 5xx still surfaces as HTTPError with a response."""
+    server.statuses = [503, 503, 503]
+    
+    with _client(server, retry_attempts=3) as client:
+        with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+            client.get("items")
+    
+    response = excinfo.value.response
+    assert response is not None
+    assert response.status_code == 503
+    assert len(server.requests) == 3
+
+
+def test_api_client_uses_current_headers(server):
+    """Test that headers changed after construction are sent."""
+    with _client(server) as client:
+        client.headers["Authorization"] = "Bearer token"
+        client.get("items")
+    
+    assert server.requests[0][2]["Authorization"] == "Bearer token"
+
+
+def test_query_batcher_preserves_order_across_statements(monkeypatch):
+    """Test that batched results come back in the order queries were added."""
+    db = DatabaseQuery("sqlite://")
+    calls = []
+    
+    def fake_execute_many(query, params_list):
+        calls.append((query, params_list))
+        return [[{"query": query, **params}] for params in params_list]
+    
+    monkeypatch.setattr(db, "execute_many", fake_execute_many)
+    
+    with db.batch() as batch:
+        batch.add("SELECT a", {"id": 1})
+        batch.add("SELECT b", {"id": 2})
+        batch.add("SELECT a", {"id": 3})
+        results = batch.flush()
+    
+    assert calls == [("SELECT a", [{"id": 1}, {"id": 3}]), ("SELECT b", [{"id": 2}])]
+    assert results == [
+        [{"query": "SELECT a", "id": 1}],
+        [{"query": "SELECT b", "id": 2}],
+        [{"query": "SELECT a", "id": 3}],
+    ]
+
+
+def test_execute_query_in_builds_placeholders(monkeypatch):
+    """Test the IN query and parameters generated for a list of values."""
+    db = DatabaseQuery("sqlite://")
+    calls = []
+    monkeypatch.setattr(db, "execute_query", lambda query, params=None: calls.append((query, params)) or [])
+    
+    db.execute_query_in("SELECT * FROM orders", "orders.id", [10, 20])
+    
+    assert calls == [(
+        "SELECT * FROM orders WHERE orders.id IN (:in_0, :in_1)",
+        {"in_0": 10, "in_1": 20},
+    )]
+    assert db.execute_query_in("SELECT * FROM orders", "id", []) == []
+    assert len(calls) == 1
+    
+    with pytest.raises(ValueError):
+        db.execute_query_in("SELECT * FROM orders", "id; DROP TABLE orders", [1])
+
+
+def test_write_stream_and_iter_lines(tmp_path):
+    """Test streaming a file out and back in line by line."""
+    processor = FileProcessor(str(tmp_path))
+    processor.write_stream("out/data.txt", (f"line {i}\n" for i in range(3)))
+    
+    assert list(processor.iter_lines("out/data.txt", chunk_size=4)) == ["line 0\n", "line 1\n", "line 2\n"]
+    assert processor.read_file("out/data.txt") == "line 0\nline 1\nline 2\n"
+
+
+def test_iter_lines_missing_file_raises_immediately(tmp_path):
+    """Test that a missing file is reported when iter_lines is called, like read_file."""
+    processor = FileProcessor(str(tmp_path))
+    
+    with pytest.raises(FileNotFoundError):
+        processor.iter_lines("missing.txt")
+
+
+def test_api_client_cache_hit_within_ttl(server):
+    """Test that repeated GETs within the TTL are served from the cache."""
+    with _client(server, cache_ttl=60) as client:
+        first = client.get("items", {"q": 1})
+        second = client.get("/items", {"q": 1})
+    
+    assert first == second == {"count": 1}
+    assert len(server.requests) == 1
+
+
+def test_api_client_cache_miss_after_expiry(server, monkeypatch):
+    """Test that an expired entry is fetched again."""
+    now = [1000.0]
+    monkeypatch.setattr(enterprise_tools.time, "monotonic", lambda: now[0])
+    
+    with _client(server, cache_ttl=10) as client:
+        client.get("items")
+        now[0] += 11
+        assert client.get("items") == {"count": 2}
+    
+    assert len(server.requests) == 2
+
+
+def test_api_client_cache_evicts_oldest(server):
+    """Test that the oldest entry is evicted at cache_maxsize."""
+    with _client(server, cache_ttl=60, cache_maxsize=2) as client:
+        client.get("a")
+        client.get("b")
+        client.get("c")
+        client.get("b")
+        client.get("a")
+    
+    assert [path for _, path, _ in server.requests] == ["/a", "/b", "/c", "/a"]
+
+
+def test_api_client_invalidate_endpoint(server):
+    """Test that invalidate() drops only the given endpoint."""
+    with _client(server, cache_ttl=60) as client:
+        client.get("a")
+        client.get("b")
+        client.invalidate("/a")
+        client.get("a")
+        client.get("b")
+    
+    assert [path for _, path, _ in server.requests] == ["/a", "/b", "/a"]
+
+
+def test_api_client_never_caches_post(server):
+    """Test that POST requests always reach the server."""
+    with _client(server, cache_ttl=60) as client:
+        client.post("items", json={"x": 1})
+        client.post("items", json={"x": 1})
+    
+    assert len(server.requests) == 2
+
+
+def test_api_client_cached_response_not_aliased(server):
+    """Test that mutating a returned response does not corrupt the cache."""
+    with _client(server, cache_ttl=60) as client:
+        client.get("items")["count"] = 99
+        cached = client.get("items")
+        cached["count"] = 42
+        assert client.get("items") == {"count": 1}
+
+
+def test_api_client_unsortable_params_skip_cache(server):
+    """Test that params with mixed key types bypass the cache instead of failing."""
+    with _client(server, cache_ttl=60) as client:
+        client.get("items", {1: "a", "b": 2})
+        client.get("items", {1: "a", "b": 2})
+    
+    assert len(server.requests) == 2
+
+
+def test_api_client_zero_maxsize_disables_cache(server):
+    """Test that cache_maxsize=0 turns caching off instead of failing."""
+    with _client(server, cache_ttl=60, cache_maxsize=0) as client:
+        client.get("items")
+        client.get("items")
+    
+    assert len(server.requests) == 2
+
+
+def test_api_client_expired_entries_evicted_first(server, monkeypatch):
+    """Test that expired entries are dropped before live ones when storing."""
+    now = [1000.0]
+    monkeypatch.setattr(enterprise_tools.time, "monotonic", lambda: now[0])
+    
+    with _client(server, cache_ttl=10, cache_maxsize=3) as client:
+        client.get("a")
+        client.get("b")
+        now[0] += 5
+        client.get("c")
+        now[0] += 6
+        client.get("d")
+        assert list(client._cache) == [("c", ()), ("d", ())]
+        client.get("c")
+    
+    assert [path for _, path, _ in server.requests] == ["/a", "/b", "/c", "/d"]
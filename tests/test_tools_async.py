@@ -0,0 +1,69 @@
+"""Tests for asynchronous enterprise tools."""
+
+import asyncio
+from typing import Any, List, Tuple
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer as _TestServer
+
+from src.tools.enterprise_tools_async import AsyncAPIClient
+
+
+async def _get_with_statuses(statuses: List[int], retry_attempts: int = 3) -> Tuple[Any, List[str]]:
+    """Serve the given statuses in order, then GET once; returns (result or error, paths received)."""
+    received = []
+    
+    async def handler(request):
+        received.append(request.path)
+        status = statuses.pop(0) if statuses else 200
+        return web.json_response({"count": len(received)}, status=status)
+    
+    app = web.Application()
+    app.router.add_get("/items", handler)
+    server = _TestServer(app)
+    await server.start_server()
+    try:
+        async with AsyncAPIClient(str(server.make_url("")), retry_attempts=retry_attempts) as client:
+            try:
+                return await client.get("items"), received
+            except aiohttp.ClientResponseError as e:
+                return e, received
+    finally:
+        await server.close()
+
+
+def test_async_api_client_success():
+    """Test a successful GET."""
+    result, received = asyncio.run(_get_with_statuses([]))
+    
+    assert result == {"count": 1}
+    assert received == ["/items"]
+
+
+def test_async_api_client_retries_server_errors():
+    """Test that 5xx responses are retried until one succeeds."""
+    result, received = asyncio.run(_get_with_statuses([503]))
+    
+    assert result == {"count": 2}
+    assert len(received) == 2
+
+
+def test_async_api_client_raises_after_last_server_error():
+    """Test that a persistent 5xx raises once the attempts are used up."""
+    error, received = asyncio.run(_get_with_statuses([503, 503], retry_attempts=2))
+    
+    assert isinstance(error, aiohttp.ClientResponseError)
+    assert error.status == 503
+    assert len(received) == 2
+
+
+def test_async_api_client_does_not_retry_client_errors():
+    """Test that 4xx responses other than 429 fail after one attempt."""
+    error, received = asyncio.run(_get_with_statuses([404]))
+    
+    assert isinstance(error, aiohttp.ClientResponseError)
+    assert error.status == 404
+    assert received == ["/items"]
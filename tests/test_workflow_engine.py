@@ -0,0 +1,227 @@
+"""Tests for Workflow Engine."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.workflows.workflow_engine import AsyncWorkflowEngine, WorkflowEngine, Workflow
+
+
+def test_topo_order_respects_dependencies():
+    """Test that tasks are ordered after their dependencies."""
+    workflow = Workflow("test_workflow")
+    workflow.add_task("fulfill", lambda ctx: None, dependencies=["payment"])
+    workflow.add_task("payment", lambda ctx: None, dependencies=["validate"])
+    workflow.add_task("validate", lambda ctx: None)
+    
+    assert workflow.topo_order() == ["validate", "payment", "fulfill"]
+
+
+def test_topo_order_detects_cycles():
+    """Test that circular dependencies are reported."""
+    workflow = Workflow("test_workflow")
+    workflow.add_task("a", lambda ctx: None, dependencies=["b"])
+    workflow.add_task("b", lambda ctx: None, dependencies=["a"])
+    
+    with pytest.raises(RuntimeError):
+        workflow.topo_order()
+
+
+def test_levels_group_independent_tasks():
+    """Test that independent tasks share a level."""
+    workflow = Workflow("test_workflow")
+    workflow.add_task("validate", lambda ctx: None)
+    workflow.add_task("payment", lambda ctx: None, dependencies=["validate"])
+    workflow.add_task("inventory", lambda ctx: None, dependencies=["validate"])
+    workflow.add_task("fulfill", lambda ctx: None, dependencies=["payment", "inventory"])
+    
+    assert workflow.levels() == [["validate"], ["payment", "inventory"], ["fulfill"]]
+
+
+def test_workflow_execution():
+    """Test executing a workflow in dependency order."""
+    calls = []
+    workflow = Workflow("test_workflow")
+    workflow.add_task("validate", lambda ctx: calls.append("validate") or True)
+    workflow.add_task("payment", lambda ctx: calls.append("payment") or ctx["amount"], dependencies=["validate"])
+    
+    engine = WorkflowEngine()
+    engine.register_workflow(workflow)
+    results = engine.execute_workflow("test_workflow", {"amount": 42})
+    
+    assert calls == ["validate", "payment"]
+    assert results["payment"]["status"] == "completed"
+    assert results["payment"]["result"] == 42
+
+
+def test_workflow_task_failure():
+    """Test that a failing task is recorded without stopping the workflow."""
+    def fail(ctx):
+        raise ValueError("boom")
+    
+    workflow = Workflow("test_workflow")
+    workflow.add_task("fail", fail)
+    workflow.add_task("after", lambda ctx: "ok", dependencies=["fail"])
+    
+    engine = WorkflowEngine()
+    engine.register_workflow(workflow)
+    results = engine.execute_workflow("test_workflow")
+    
+    assert results["fail"]["status"] == "failed"
+    assert results["fail"]["error"] == "boom"
+    assert results["after"]["status"] == "completed"
+
+
+def test_independent_tasks_run_concurrently():
+    """Test that tasks in the same level are dispatched in parallel."""
+    barrier = threading.Barrier(2, timeout=5)
+    workflow = Workflow("test_workflow")
+    workflow.add_task("a", lambda ctx: barrier.wait())
+    workflow.add_task("b", lambda ctx: barrier.wait())
+    
+    engine = WorkflowEngine(max_workers=2)
+    engine.register_workflow(workflow)
+    results = engine.execute_workflow("test_workflow")
+    
+    assert results["a"]["status"] == "completed"
+    assert results["b"]["status"] == "completed"
+
+
+def test_cacheable_task_reuses_result():
+    """Test that cacheable tasks are skipped when the context is unchanged."""
+    calls = []
+    workflow = Workflow("test_workflow")
+    workflow.add_task("lookup", lambda ctx: calls.append(ctx["id"]) or ctx["id"], cacheable=True)
+    
+    engine = WorkflowEngine()
+    engine.register_workflow(workflow)
+    engine.execute_workflow("test_workflow", {"id": 1})
+    engine.execute_workflow("test_workflow", {"id": 1})
+    engine.execute_workflow("test_workflow", {"id": 2})
+    assert calls == [1, 2]
+    
+    engine.invalidate_cache("lookup")
+    results = engine.execute_workflow("test_workflow", {"id": 1})
+    assert calls == [1, 2, 1]
+    assert results["lookup"]["result"] == 1
+
+
+def test_async_workflow_execution():
+    """Test that the async engine awaits independent coroutine tasks concurrently."""
+    async def wait_for_peer(ctx):
+        ctx["arrived"] += 1
+        while ctx["arrived"] < 2:
+            await asyncio.sleep(0)
+        return ctx["arrived"]
+    
+    workflow = Workflow("test_workflow")
+    workflow.add_task("a", wait_for_peer)
+    workflow.add_task("b", wait_for_peer)
+    workflow.add_task("total", lambda ctx: ctx["arrived"], dependencies=["a", "b"])
+    
+    engine = AsyncWorkflowEngine()
+    engine.register_workflow(workflow)
+    results = asyncio.run(asyncio.wait_for(engine.execute_workflow("test_workflow", {"arrived": 0}), timeout=5))
+    
+    assert results["a"]["status"] == "completed"
+    assert results["total"]["result"] == 2
+
+
+def test_injected_executor_is_used_and_left_open():
+    """Test that a caller-supplied executor runs tasks and is not shut down by the engine."""
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="custom") as executor:
+        workflow = Workflow("test_workflow")
+        workflow.add_task("where", lambda ctx: threading.current_thread().name)
+        
+        with WorkflowEngine(executor=executor) as engine:
+            engine.register_workflow(workflow)
+            results = engine.execute_workflow("test_workflow")
+        
+        assert results["where"]["result"].startswith("custom")
+        assert executor.submit(lambda: "still open").result() == "still open"
+
+
+def test_compiled_workflow_recompiles_after_add_task():
+    """Test that a compiled workflow picks up tasks added after registration."""
+    def fail(ctx):
+        raise ValueError("boom")
+    
+    workflow = Workflow("test_workflow")
+    workflow.add_task("validate", lambda ctx: "ok")
+    workflow.add_task("payment", fail, dependencies=["validate"])
+    
+    engine = WorkflowEngine(max_workers=1)
+    engine.register_workflow(workflow)
+    results = engine.execute_workflow("test_workflow")
+    assert results["validate"]["result"] == "ok"
+    assert results["payment"]["status"] == "failed"
+    assert results["payment"]["error"] == "boom"
+    
+    workflow.add_task("fulfill", lambda ctx: "shipped", dependencies=["payment"])
+    results = engine.execute_workflow("test_workflow")
+    assert results["fulfill"]["result"] == "shipped"
+
+
+def test_cache_discarded_when_action_replaced():
+    """Test that replacing a cacheable task's action does not serve stale results."""
+    workflow = Workflow("test_workflow")
+    workflow.add_task("t", lambda ctx: 1, cacheable=True)
+    
+    engine = WorkflowEngine()
+    engine.register_workflow(workflow)
+    assert engine.execute_workflow("test_workflow")["t"]["result"] == 1
+    
+    workflow.add_task("t", lambda ctx: 2, cacheable=True)
+    assert engine.execute_workflow("test_workflow")["t"]["result"] == 2
+
+
+def test_result_cache_is_bounded():
+    """Test that the least recently used results are evicted beyond cache_maxsize."""
+    calls = []
+    workflow = Workflow("test_workflow")
+    workflow.add_task("t", lambda ctx: calls.append(ctx["id"]) or ctx["id"], cacheable=True)
+    
+    engine = WorkflowEngine(cache_maxsize=2)
+    engine.register_workflow(workflow)
+    for context_id in (1, 2, 1, 3, 1, 2):
+        engine.execute_workflow("test_workflow", {"id": context_id})
+    
+    # 2 is evicted when 3 is added, because 1 was used more recently
+    assert calls == [1, 2, 3, 2]
+
+
+def test_engine_from_config():
+    """Test that concurrency settings are read from the workflows section."""
+    engine = WorkflowEngine.from_config({"workflows": {"max_concurrent_tasks": 3}})
+    assert engine.max_workers == 3
+    
+    engine = WorkflowEngine.from_config({
+        "workflows": {"max_concurrent_tasks": 3, "enable_parallel_execution": False}
+    })
+    assert engine.max_workers == 1
+    
+    assert WorkflowEngine.from_config({}).max_workers == 5
+
+
+@pytest.mark.parametrize("max_workers", [1, 5])
+def test_rerun_failure_clears_previous_result(max_workers):
+    """Test that a task failing on a rerun does not keep its earlier result."""
+    outcomes = ["ok", ValueError("boom")]
+    
+    def flaky(ctx):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    workflow = Workflow("test_workflow")
+    workflow.add_task("flaky", flaky)
+    workflow.add_task("other", lambda ctx: None)
+    
+    engine = WorkflowEngine(max_workers=max_workers)
+    engine.register_workflow(workflow)
+    assert engine.execute_workflow("test_workflow")["flaky"]["result"] == "ok"
+    
+    results = engine.execute_workflow("test_workflow")
+    assert results["flaky"] == {"status": "failed", "result": None, "error": "boom"}